@@ -204,9 +204,9 @@ def _format_output(
 
         return yaml.dump(results, default_flow_style=False, allow_unicode=True)
     elif workflow.output and workflow.output.template and isinstance(results, dict):
-        from .core.template_engine import WorkflowTemplateEngine
+        from .core.template_engine import get_shared_template_engine
 
-        engine = WorkflowTemplateEngine()
+        engine = get_shared_template_engine()
         context = {"steps": results, "input": input_data or {}}
         return engine.render(workflow.output.template, context)
     elif isinstance(results, dict) and len(results) == 1:
@@ -288,12 +288,17 @@ def _execute_workflow(
 
     import asyncio
 
+    # Run on uvloop/winloop when installed (AI calls are I/O bound)
+    loop_factory = WorkflowExecutionEngine.event_loop_factory()
+
     # Use workflow progress context manager
     if progress_manager:
         with progress_manager.workflow_progress(workflow.name, len(workflow.steps)):
-            results = asyncio.run(engine.execute_workflow(workflow, context))
+            results = asyncio.run(
+                engine.execute_workflow(workflow, context), loop_factory=loop_factory
+            )
     else:
-        results = asyncio.run(engine.execute_workflow(workflow, context))
+        results = asyncio.run(engine.execute_workflow(workflow, context), loop_factory=loop_factory)
 
     return results, context
 
@@ -1,10 +1,12 @@
 """AI provider abstraction layer using LiteLLM"""
 
 import asyncio
+import hashlib
 import os
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any, TypedDict
 
 import litellm
@@ -87,6 +89,84 @@ class AIResponse(BaseModel):
     cost_usd: float | None = None
 
 
+# Cache key: (serialized provider configuration, prompt digest)
+type ResponseCacheKey = tuple[str, bytes]
+
+
+class _AbandonedRequestError(Exception):
+    """Set on a shared AI request whose leading caller stopped before it finished"""
+
+
+class AIResponseCache:
+    """Bounded LRU cache of AI responses keyed by provider configuration and prompt
+
+    Concurrent requests for the same key are coalesced so that only one of them
+    reaches the provider while the others wait for its response.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[ResponseCacheKey, AIResponse] = OrderedDict()
+        self._pending: dict[ResponseCacheKey, asyncio.Future[AIResponse]] = {}
+
+    @staticmethod
+    def make_key(config: AIProviderConfig, prompt: str) -> ResponseCacheKey:
+        """Build a cache key without keeping the full prompt text"""
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        return config.model_dump_json(), digest
+
+    def get(self, key: ResponseCacheKey) -> AIResponse | None:
+        """Get a cached response, marking it as recently used"""
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: ResponseCacheKey, response: AIResponse) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_complete(
+        self, key: ResponseCacheKey, complete: Callable[[], Awaitable[AIResponse]]
+    ) -> AIResponse:
+        """Get a cached response, or run ``complete`` once for all concurrent callers"""
+        cached_response = self.get(key)
+        if cached_response is not None:
+            return cached_response
+
+        while (pending := self._pending.get(key)) is not None:
+            try:
+                # Shield so that cancelling one waiter does not cancel the shared request
+                return await asyncio.shield(pending)
+            except _AbandonedRequestError:
+                # The leading caller was cancelled; the first waiter to resume takes over
+                continue
+
+        future: asyncio.Future[AIResponse] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            response = await complete()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved; waiters (if any) still receive the exception
+            future.exception()
+            raise
+        except BaseException:
+            # Waiters retry the request instead of inheriting this caller's cancellation
+            future.set_exception(_AbandonedRequestError())
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+        future.set_result(response)
+        self.put(key, response)
+        return response
+
+
 class AIProviderError(Exception):
     """Error from AI provider"""
 
@@ -137,6 +217,26 @@ class AIProvider(BaseAIProvider):
         # Configure litellm settings
         litellm.drop_params = True  # Drop unsupported params instead of failing
 
+        # Completion parameters that do not depend on the prompt, built once since
+        # the same provider is reused for every call (and retry) of its configuration
+        self._base_params = self._build_base_params()
+
+    def _build_base_params(self) -> dict[str, Any]:
+        """Build the prompt-independent completion parameters from the config"""
+        params: dict[str, Any] = {
+            "model": self.config.provider,
+            "temperature": self.config.temperature,
+            "timeout": self.config.timeout,
+        }
+
+        # Add max_tokens if specified
+        if self.config.max_tokens:
+            params["max_tokens"] = self.config.max_tokens
+
+        # Add extra parameters
+        params.update(self.config.extra_params)
+        return params
+
     def _setup_api_keys(self) -> None:
         """Set up API keys from environment variables or config"""
         # Google Gemini
@@ -161,28 +261,18 @@ class AIProvider(BaseAIProvider):
 
     async def complete(self, prompt: str, **kwargs: CompletionKwargs) -> AIResponse:
         """Generate completion from AI provider"""
-        # Merge config with call-specific parameters
-        params = {
-            "model": self.config.provider,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": kwargs.get("temperature", self.config.temperature),
-            "timeout": kwargs.get("timeout", self.config.timeout),
-        }
-
-        # Add max_tokens if specified
-        max_tokens = kwargs.get("max_tokens", self.config.max_tokens)
-        if max_tokens:
-            params["max_tokens"] = max_tokens
-
-        # Add extra parameters
-        params.update(self.config.extra_params)
-        params.update(kwargs)
+        # Merge precomputed config parameters with call-specific parameters
+        params = {"messages": [{"role": "user", "content": prompt}], **self._base_params}
+        if kwargs:
+            params.update(kwargs)
 
         # Retry logic
         last_error = None
         for attempt in range(self.config.max_retries + 1):
             try:
-                response = litellm.completion(**params)
+                # acompletion reuses LiteLLM's pooled async HTTP clients and
+                # does not block the event loop while waiting for the response
+                response = await litellm.acompletion(**params)
                 # if not isinstance(response, TextContent):
                 #     raise AIProviderError(
                 #         "Response is not text content. Check your provider configuration.",
@@ -230,23 +320,14 @@ class AIProvider(BaseAIProvider):
         self, prompt: str, **kwargs: CompletionKwargs
     ) -> AsyncGenerator[str, None]:
         """Generate streaming completion from AI provider"""
-        # Merge config with call-specific parameters
+        # Merge precomputed config parameters with call-specific parameters
         params = {
-            "model": self.config.provider,
             "messages": [{"role": "user", "content": prompt}],
-            "temperature": kwargs.get("temperature", self.config.temperature),
-            "timeout": kwargs.get("timeout", self.config.timeout),
             "stream": True,
+            **self._base_params,
         }
-
-        # Add max_tokens if specified
-        max_tokens = kwargs.get("max_tokens", self.config.max_tokens)
-        if max_tokens:
-            params["max_tokens"] = max_tokens
-
-        # Add extra parameters
-        params.update(self.config.extra_params)
-        params.update(kwargs)
+        if kwargs:
+            params.update(kwargs)
 
         try:
             response = litellm.completion(**params)
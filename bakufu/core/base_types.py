@@ -1,21 +1,45 @@
 """Base types for workflow steps to avoid circular imports"""
 
+import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Literal
+from enum import StrEnum
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .models.execution import ExecutionContext
 
 
+class ErrorAction(StrEnum):
+    """Action to take when a step (or condition evaluation) fails
+
+    Values are validated into members once at load time, so runtime checks are
+    identity comparisons instead of string comparisons.
+    """
+
+    STOP = "stop"
+    CONTINUE = "continue"
+    SKIP_REMAINING = "skip_remaining"
+
+
 class WorkflowStep(BaseModel, ABC):
     """Base workflow step definition with polymorphic execution"""
 
-    id: str = Field(..., description="Unique step identifier")
+    # Interned once at load time: the ID keys step outputs and usage records, and
+    # lookups from templates (whose attribute names are interned) then match by identity
+    id: Annotated[str, AfterValidator(sys.intern)] = Field(
+        ..., description="Unique step identifier"
+    )
     type: Literal["ai_call", "text_process", "collection", "conditional"]
     description: str | None = None
-    on_error: Literal["stop", "continue", "skip_remaining"] = "stop"
+    on_error: ErrorAction = ErrorAction.STOP
+    depends_on: list[str] = Field(
+        default_factory=list,
+        description="IDs of steps that must finish before this step (earlier steps unless parallel)",
+    )
 
     @abstractmethod
     async def execute(self, context: "ExecutionContext") -> Any:
@@ -33,4 +57,27 @@ class WorkflowStep(BaseModel, ABC):
         pass
 
 
+def validate_sequential_dependencies(steps: "Sequence[WorkflowStep]") -> None:
+    """Check that ``depends_on`` only names earlier steps of a list run in declaration order
+
+    Raises:
+        ValueError: If a step depends on itself, on a later step or on an unknown step
+    """
+    step_ids = {step.id for step in steps}
+    declared: set[str] = set()
+    for step in steps:
+        for dependency in step.depends_on:
+            if dependency in declared:
+                continue
+            if dependency == step.id:
+                raise ValueError(f"Step '{step.id}' cannot depend on itself")
+            if dependency in step_ids:
+                raise ValueError(
+                    f"Step '{step.id}' depends on step '{dependency}', which is declared after it "
+                    "(these steps run in declaration order)"
+                )
+            raise ValueError(f"Step '{step.id}' depends on unknown step '{dependency}'")
+        declared.add(step.id)
+
+
 # Forward declaration removed as it conflicts with the actual implementation
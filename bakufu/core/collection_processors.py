@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from .exceptions import StepExecutionError
 
 if TYPE_CHECKING:
+    from .execution_engine import WorkflowExecutionEngine
     from .models import (
         CollectionResult,
         CollectionStep,
@@ -21,14 +22,26 @@ class CollectionProcessor:
     def __init__(self, step: "CollectionStep", progress_callback: Callable | None = None):
         self.step = step
         self.progress_callback = progress_callback
-        self.start_time = 0.0
-        self.processing_stats: dict[str, Any] = {}
+        # Engine for nested map/reduce steps, created on first use
+        self._engine: WorkflowExecutionEngine | None = None
+
+    def _get_engine(self) -> "WorkflowExecutionEngine":
+        """Get the engine used to run nested steps, reused across items and calls"""
+        if self._engine is None:
+            from .execution_engine import WorkflowExecutionEngine
+
+            self._engine = WorkflowExecutionEngine()
+        return self._engine
 
     async def process(self, input_data: Any, context: "ExecutionContext") -> "CollectionResult":
-        """Process collection operation and return CollectionResult"""
+        """Process collection operation and return CollectionResult
+
+        Keeps no per-call state on the processor, so one instance can be reused
+        for every execution of its step.
+        """
         from .models import CollectionResult
 
-        self.start_time = time.time()
+        start_time = time.time()
 
         try:
             # Evaluate input
@@ -47,8 +60,8 @@ class CollectionProcessor:
             result = await self._dispatch_operation(evaluated_input, context)
 
             # Calculate processing stats
-            processing_time = time.time() - self.start_time
-            self.processing_stats = {
+            processing_time = time.time() - start_time
+            processing_stats = {
                 "processing_time": processing_time,
                 "operation": self.step.operation,
                 "input_count": len(evaluated_input),
@@ -60,7 +73,7 @@ class CollectionProcessor:
                 operation=self.step.operation,
                 input_count=len(evaluated_input),
                 output_count=len(result) if isinstance(result, list) else 1,
-                processing_stats=self.processing_stats,
+                processing_stats=processing_stats,
                 errors=[],
             )
 
@@ -114,8 +127,6 @@ class CollectionProcessor:
 
     async def _process_map(self, input_list: list[Any], context: "ExecutionContext") -> list[Any]:
         """Process map operation - transform each element"""
-        from .execution_engine import WorkflowExecutionEngine
-
         if not hasattr(self.step, "steps"):
             raise StepExecutionError(
                 message="Map operation requires 'steps' field",
@@ -124,7 +135,7 @@ class CollectionProcessor:
             )
 
         results = []
-        engine = WorkflowExecutionEngine()
+        engine = self._get_engine()
 
         # Check if concurrency is configured for parallel processing
         if (
@@ -245,8 +256,6 @@ class CollectionProcessor:
 
     async def _process_reduce(self, input_list: list[Any], context: "ExecutionContext") -> Any:
         """Process reduce operation - aggregate elements into single value"""
-        from .execution_engine import WorkflowExecutionEngine
-
         if not hasattr(self.step, "steps"):
             raise StepExecutionError(
                 message="Reduce operation requires 'steps' field",
@@ -258,7 +267,7 @@ class CollectionProcessor:
         accumulator = getattr(self.step, "initial_value", None)
         accumulator_var = getattr(self.step, "accumulator_var", "acc")
         item_var = getattr(self.step, "item_var", "item")
-        engine = WorkflowExecutionEngine()
+        engine = self._get_engine()
         for item in input_list:
             # Create context with accumulator and item variables
             reduce_context = context.model_copy(deep=True)
@@ -1,6 +1,8 @@
 """Enhanced error handling and exception classes for bakufu"""
 
+import re
 import traceback
+from collections.abc import Sequence
 from typing import Any, TypedDict
 
 from pydantic import BaseModel
@@ -19,6 +21,9 @@ class ValidationFieldError(TypedDict, total=False):
 ErrorDict = dict[str, Any]  # Error dictionary for serialization
 InputDataDict = dict[str, Any]  # Input data dictionary in error context
 
+# Matches the location part of a traceback frame line: 'File "...", line 42, in func'
+_TRACEBACK_LINE_RE = re.compile(r", line (\d+), in ")
+
 
 class ErrorContext(BaseModel):
     """Context information for errors"""
@@ -40,14 +45,15 @@ class BakufuError(Exception):
         error_code: str,
         context: ErrorContext | None = None,
         original_error: Exception | None = None,
-        suggestions: list[str] | None = None,
+        suggestions: Sequence[str] | None = None,
     ):
         super().__init__(message)
         self.message = message
         self.error_code = error_code
         self.context = context or ErrorContext()
         self.original_error = original_error
-        self.suggestions = suggestions or []
+        # Own a list so shared constant tuples can be passed and subclasses can extend it
+        self.suggestions = list(suggestions) if suggestions else []
         self.traceback_str = traceback.format_exc() if original_error else None
 
     def __str__(self) -> str:
@@ -251,7 +257,7 @@ class ResourceError(BakufuError):
 
 
 def create_error_from_exception(
-    exc: Exception, context: ErrorContext | None = None, suggestions: list[str] | None = None
+    exc: Exception, context: ErrorContext | None = None, suggestions: Sequence[str] | None = None
 ) -> BakufuError:
     """Create appropriate BakufuError from a generic exception"""
 
@@ -333,15 +339,5 @@ class ErrorReporter:
     @staticmethod
     def extract_line_number_from_traceback(tb_str: str) -> int | None:
         """Extract line number from traceback string"""
-        try:
-            lines = tb_str.split("\n")
-            for line in lines:
-                if "line " in line and ", in " in line:
-                    # Look for pattern like "line 42, in function_name"
-                    parts = line.split("line ")
-                    if len(parts) > 1:
-                        line_part = parts[1].split(",")[0].strip()
-                        return int(line_part)
-        except (ValueError, IndexError):
-            pass
-        return None
+        match = _TRACEBACK_LINE_RE.search(tb_str)
+        return int(match.group(1)) if match else None
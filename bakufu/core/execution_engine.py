@@ -1,26 +1,33 @@
-"""Workflow execution engine for running steps sequentially
+"""Workflow execution engine for running workflow steps
 
 This module implements the main WorkflowExecutionEngine using the Command Pattern
 with polymorphic dispatch for truly decoupled step execution.
 """
 
-from collections.abc import Callable
-from typing import Any
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
-from .base_types import WorkflowStep
+from .base_types import ErrorAction, WorkflowStep
 from .exceptions import (
     ErrorContext,
     StepExecutionError,
 )
 from .models import (
+    AICallStep,
     ConditionalStep,
     ExecutionContext,
     Workflow,
 )
 
+if TYPE_CHECKING:
+    from .ai_provider import AIResponseCache, BaseAIProvider
+
 # Type aliases for better type safety
 type StepResult = Any  # Step results can be of various types based on step type
 type WorkflowResults = dict[str, StepResult]  # Workflow results are step_id -> result mappings
+type StepHandler = Callable[[Any, ExecutionContext], Awaitable[StepResult]]
 
 
 class WorkflowExecutionEngine:
@@ -33,94 +40,195 @@ class WorkflowExecutionEngine:
     def __init__(self, progress_callback: Callable | None = None) -> None:
         """Initialize execution engine"""
         self.progress_callback = progress_callback
+        # AI providers reused across steps and workflow runs, keyed by configuration
+        self._provider_cache: dict[str, BaseAIProvider] = {}
+        # Responses of cacheable AI steps, created on first use
+        self._response_cache: AIResponseCache | None = None
+        # Step types that need engine collaborators; all others call step.execute directly
+        self._step_handlers: dict[type[WorkflowStep], StepHandler] = {
+            ConditionalStep: self._execute_conditional_step,
+            AICallStep: self._execute_ai_call_step,
+        }
 
     async def execute_workflow(
         self, workflow: Workflow, context: ExecutionContext
     ) -> WorkflowResults:
         """Execute complete workflow with all steps"""
-        results = {}
+        results: WorkflowResults = {}
+        # Bound once; event kwargs are only built when a callback is installed
+        notify = self.progress_callback
 
         # Notify workflow start
-        if self.progress_callback:
-            self.progress_callback(
-                "workflow_start", workflow_name=workflow.name, total_steps=len(workflow.steps)
-            )
-
-        for i, step in enumerate(workflow.steps, 1):
-            # Notify step start
-            if self.progress_callback:
-                self.progress_callback(
-                    "workflow_step", current_step=i, step_name=step.id, step_type=step.type
-                )
+        if notify:
+            notify("workflow_start", workflow_name=workflow.name, total_steps=len(workflow.steps))
+
+        if workflow.parallel:
+            await self._execute_workflow_levels(workflow, context, results)
+        else:
+            execute_step = self.execute_step
+            for i, step in enumerate(workflow.steps, 1):
+                # Notify step start
+                if notify:
+                    notify("workflow_step", current_step=i, step_name=step.id, step_type=step.type)
+
+                failed = False
+                try:
+                    result = await execute_step(step, context)
+                except Exception as e:
+                    # Only the terminal path needs the wrapped error and its context
+                    if step.on_error is ErrorAction.STOP:
+                        raise self._to_step_execution_error(e, step, workflow) from e
+                    # "continue" and "skip_remaining" record None for the failed step
+                    result = None
+                    failed = True
 
-            try:
-                result = await self.execute_step(step, context)
                 context.set_step_output(step.id, result)
                 results[step.id] = result
-
-            except Exception as e:
-                error_context = ErrorContext(
-                    step_id=step.id, workflow_name=workflow.name, function_name="execute_workflow"
-                )
-
-                if isinstance(e, StepExecutionError):
-                    error = e
-                else:
-                    error = StepExecutionError(
-                        message=str(e),
-                        step_id=step.id,
-                        workflow_name=workflow.name,
-                        context=error_context,
-                        original_error=e,
-                    )
-
-                if step.on_error == "stop":
-                    raise error from e
-                elif step.on_error == "continue":
-                    context.set_step_output(step.id, None)
-                    results[step.id] = None
-                    continue
-                elif step.on_error == "skip_remaining":
-                    context.set_step_output(step.id, None)
-                    results[step.id] = None
+                if failed and step.on_error is ErrorAction.SKIP_REMAINING:
                     break
 
         # Notify workflow completion
-        if self.progress_callback:
-            self.progress_callback("workflow_complete")
+        if notify:
+            notify("workflow_complete")
 
         return results
 
-    async def execute_step(self, step: WorkflowStep, context: ExecutionContext) -> StepResult:
-        """Execute a single workflow step using polymorphic dispatch (Command Pattern)"""
-        # For ConditionalStep, we need to provide step_executor for nested execution
-        if isinstance(step, ConditionalStep):
-            return await step.execute(context, step_executor=self.execute_step)
+    async def _execute_workflow_levels(
+        self, workflow: Workflow, context: ExecutionContext, results: WorkflowResults
+    ) -> None:
+        """Execute top-level steps level by level, running each level concurrently
+
+        Outputs are recorded in declaration order once the whole level has finished,
+        so steps in the same level never observe each other's results.
+        """
+        notify = self.progress_callback
+        step_number = 0
+        for level in workflow.get_execution_levels():
+            if notify:
+                for step in level:
+                    step_number += 1
+                    notify(
+                        "workflow_step",
+                        current_step=step_number,
+                        step_name=step.id,
+                        step_type=step.type,
+                    )
 
-        # For all other steps, use polymorphic execute method
-        return await step.execute(context)
+            # A failing "stop" step cancels the rest of its level
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [
+                        task_group.create_task(self._execute_level_step(step, context))
+                        for step in level
+                    ]
+            except BaseExceptionGroup:
+                for step, task in zip(level, tasks, strict=True):
+                    error = None if task.cancelled() else task.exception()
+                    if error is None:
+                        continue
+                    if not isinstance(error, Exception):
+                        raise error from None
+                    raise self._to_step_execution_error(error, step, workflow) from error
+                raise
+
+            # Every step of the level has run, so record them all before skipping the rest
+            skip_remaining = False
+            for step, task in zip(level, tasks, strict=True):
+                result, failure = task.result()
+                if failure is not None:
+                    # "continue" and "skip_remaining" record None for the failed step
+                    result = None
+                    skip_remaining |= step.on_error is ErrorAction.SKIP_REMAINING
+                context.set_step_output(step.id, result)
+                results[step.id] = result
+            if skip_remaining:
+                return
 
-    # Compatibility methods for tests - delegate to strategies
-    async def _execute_ai_call_step(
+    async def _execute_level_step(
         self, step: WorkflowStep, context: ExecutionContext
-    ) -> StepResult:
-        """Delegate to step's execute method for backward compatibility with tests"""
-        return await step.execute(context)
+    ) -> tuple[StepResult, Exception | None]:
+        """Execute one step of a parallel level
+
+        Failures of steps that do not stop the workflow are returned instead of
+        raised so they do not cancel the other steps of the level.
+        """
+        try:
+            return await self.execute_step(step, context), None
+        except Exception as e:
+            if step.on_error is ErrorAction.STOP:
+                raise
+            return None, e
+
+    @staticmethod
+    def _to_step_execution_error(
+        error: Exception, step: WorkflowStep, workflow: Workflow
+    ) -> StepExecutionError:
+        """Wrap an arbitrary step failure into a StepExecutionError"""
+        if isinstance(error, StepExecutionError):
+            return error
+
+        error_context = ErrorContext(
+            step_id=step.id, workflow_name=workflow.name, function_name="execute_workflow"
+        )
+        return StepExecutionError(
+            message=str(error),
+            step_id=step.id,
+            workflow_name=workflow.name,
+            context=error_context,
+            original_error=error,
+        )
 
-    async def _execute_collection_step(
-        self, step: WorkflowStep, context: ExecutionContext
-    ) -> StepResult:
-        """Delegate to step's execute method for backward compatibility with tests"""
-        return await step.execute(context)
+    async def execute_step(self, step: WorkflowStep, context: ExecutionContext) -> StepResult:
+        """Execute a single workflow step using polymorphic dispatch (Command Pattern)"""
+        handler = self._step_handlers.get(type(step))
+        if handler is not None:
+            return await handler(step, context)
 
-    async def _execute_text_process_step(
-        self, step: WorkflowStep, context: ExecutionContext
-    ) -> StepResult:
-        """Delegate to step's execute method for backward compatibility with tests"""
+        # For all other steps, use polymorphic execute method
         return await step.execute(context)
 
     async def _execute_conditional_step(
-        self, step: WorkflowStep, context: ExecutionContext
+        self, step: ConditionalStep, context: ExecutionContext
     ) -> StepResult:
-        """Delegate to step's execute method for backward compatibility with tests"""
-        return await step.execute(context)
+        """Execute a conditional step, providing step_executor for nested execution"""
+        return await step.execute(context, step_executor=self.execute_step)
+
+    async def _execute_ai_call_step(
+        self, step: AICallStep, context: ExecutionContext
+    ) -> StepResult:
+        """Execute an AI call step with the engine's shared provider and response caches"""
+        if step.cacheable and self._response_cache is None:
+            from .ai_provider import AIResponseCache
+
+            self._response_cache = AIResponseCache()
+
+        return await step.execute(
+            context, provider_cache=self._provider_cache, response_cache=self._response_cache
+        )
+
+    @staticmethod
+    def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+        """Get a faster event loop factory (uvloop/winloop) if one is installed
+
+        Intended for ``asyncio.run(..., loop_factory=...)``; returns None to use the
+        default asyncio loop when neither package is available.
+        """
+        loop_factory: Callable[[], asyncio.AbstractEventLoop]
+        try:
+            if sys.platform == "win32":
+                import winloop
+
+                loop_factory = winloop.new_event_loop
+            else:
+                import uvloop
+
+                loop_factory = uvloop.new_event_loop
+        except ImportError:
+            return None
+        return loop_factory
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[StepResult]]:
+        """Resolve legacy ``_execute_*_step`` helpers used by tests to ``execute_step``"""
+        if name.startswith("_execute_") and name.endswith("_step"):
+            return self.execute_step
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
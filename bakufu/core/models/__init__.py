@@ -51,9 +51,11 @@ __all__ = [
     "WorkflowConfig",
 ]
 
-# Rebuild models to resolve forward references
-Workflow.model_rebuild()
-ConditionalStep.model_rebuild()
-ConditionalBranch.model_rebuild()
+# Rebuild models to resolve forward references, innermost first: each rebuild can
+# then reuse the already-complete schemas of the models it contains instead of
+# building them inline only to rebuild them again afterwards
 MapOperation.model_rebuild()
 ReduceOperation.model_rebuild()
+ConditionalBranch.model_rebuild()
+ConditionalStep.model_rebuild()
+Workflow.model_rebuild()
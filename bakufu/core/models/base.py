@@ -1,8 +1,8 @@
 """Base model definitions and common types for Bakufu workflows"""
 
-from typing import TYPE_CHECKING, Any, Literal, Union
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
 
 
 class InputParameter(BaseModel):
@@ -56,13 +56,27 @@ if TYPE_CHECKING:
     from .steps.collection import FilterOperation, MapOperation, PipelineOperation, ReduceOperation
     from .steps.conditional import ConditionalStep
 
-# Type alias for all workflow steps
-AnyWorkflowStep = Union[
-    "AICallStep",
-    "AnyTextProcessStep",
-    "MapOperation",
-    "FilterOperation",
-    "ReduceOperation",
-    "PipelineOperation",
-    "ConditionalStep",
+
+def _step_type_tag(value: Any) -> str | None:
+    """Read the step type used to pick the union member to validate against"""
+    if isinstance(value, dict):
+        return value.get("type")
+    return getattr(value, "type", None)
+
+
+# Collection operations share type "collection" and are told apart by "operation"
+AnyCollectionStep = Annotated[
+    Union["MapOperation", "FilterOperation", "ReduceOperation", "PipelineOperation"],
+    Discriminator("operation"),
+]
+
+# Type alias for all workflow steps. Steps are dispatched on their "type" tag, so
+# validation only tries the matching family instead of every step model in turn
+# (text process steps have overlapping "method" tags and are still tried in turn)
+AnyWorkflowStep = Annotated[
+    Annotated["AICallStep", Tag("ai_call")]
+    | Annotated["AnyTextProcessStep", Tag("text_process")]
+    | Annotated[AnyCollectionStep, Tag("collection")]
+    | Annotated["ConditionalStep", Tag("conditional")],
+    Discriminator(_step_type_tag),
 ]
@@ -1,25 +1,60 @@
 """Execution context and usage tracking models for Bakufu workflows"""
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from fastmcp import Context
 from pydantic import BaseModel, Field, PrivateAttr
 
-from ..template_engine import WorkflowTemplateEngine
+from ..template_engine import WorkflowTemplateEngine, get_shared_template_engine
 from .workflow import WorkflowConfig
 
+if TYPE_CHECKING:
+    from fastmcp import Context
+else:
+    # fastmcp pulls in the whole MCP stack, and a Context only exists once the MCP
+    # server is running (and has imported fastmcp), so it is not checked at runtime
+    Context = Any
 
-@dataclass
+
+@dataclass(slots=True)
 class UsageSummary:
-    """AI API usage summary"""
+    """AI API usage summary
+
+    Per-step usage is stored column-wise (parallel lists indexed by step) rather
+    than as one small dict per step; ``step_usage`` builds the dict view on demand.
+    """
 
     total_api_calls: int = 0
     total_prompt_tokens: int = 0
     total_completion_tokens: int = 0
     total_tokens: int = 0
     total_cost_usd: float = 0.0
-    step_usage: dict[str, dict] = field(default_factory=dict)
+    step_ids: list[str] = field(default_factory=list)
+    step_prompt_tokens: list[int] = field(default_factory=list)
+    step_completion_tokens: list[int] = field(default_factory=list)
+    step_total_tokens: list[int] = field(default_factory=list)
+    step_cost_usd: list[float] = field(default_factory=list)
+    _step_index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def step_usage(self) -> dict[str, dict]:
+        """Per-step usage as ``{step_id: {prompt_tokens, ..., cost_usd}}``"""
+        return {
+            step_id: {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": total_tokens,
+                "cost_usd": cost_usd,
+            }
+            for step_id, prompt_tokens, completion_tokens, total_tokens, cost_usd in zip(
+                self.step_ids,
+                self.step_prompt_tokens,
+                self.step_completion_tokens,
+                self.step_total_tokens,
+                self.step_cost_usd,
+                strict=True,
+            )
+        }
 
     def add_step_usage(
         self, step_id: str, usage: dict[str, Any] | None, cost_usd: float | None
@@ -31,12 +66,7 @@ class UsageSummary:
 
         if not usage:
             # Store step with zero usage
-            self.step_usage[step_id] = {
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0,
-                "cost_usd": cost_usd or 0.0,
-            }
+            self._set_step_usage(step_id, 0, 0, 0, cost_usd or 0.0)
             return
 
         prompt_tokens = usage.get("prompt_tokens", 0)
@@ -49,12 +79,33 @@ class UsageSummary:
         self.total_tokens += total_tokens
 
         # Store step-specific data
-        self.step_usage[step_id] = {
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "total_tokens": total_tokens,
-            "cost_usd": cost_usd or 0.0,
-        }
+        self._set_step_usage(
+            step_id, prompt_tokens, completion_tokens, total_tokens, cost_usd or 0.0
+        )
+
+    def _set_step_usage(
+        self,
+        step_id: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        total_tokens: int,
+        cost_usd: float,
+    ) -> None:
+        """Record a step's latest usage, replacing any earlier entry for the step"""
+        index = self._step_index.get(step_id)
+        if index is None:
+            self._step_index[step_id] = len(self.step_ids)
+            self.step_ids.append(step_id)
+            self.step_prompt_tokens.append(prompt_tokens)
+            self.step_completion_tokens.append(completion_tokens)
+            self.step_total_tokens.append(total_tokens)
+            self.step_cost_usd.append(cost_usd)
+            return
+
+        self.step_prompt_tokens[index] = prompt_tokens
+        self.step_completion_tokens[index] = completion_tokens
+        self.step_total_tokens[index] = total_tokens
+        self.step_cost_usd[index] = cost_usd
 
 
 class ExecutionContext(BaseModel):
@@ -73,12 +124,17 @@ class ExecutionContext(BaseModel):
         default=None, description="FastMCP Context for sampling API"
     )
 
-    # Template engine (not serialized)
-    _template_engine: WorkflowTemplateEngine = PrivateAttr(default_factory=WorkflowTemplateEngine)
+    # Template engine shared by all contexts (not serialized)
+    _template_engine: WorkflowTemplateEngine = PrivateAttr(
+        default_factory=get_shared_template_engine
+    )
 
     # Usage tracking (not serialized)
     _usage_summary: UsageSummary = PrivateAttr(default_factory=UsageSummary)
 
+    # Dumped config paired with the config it came from (not serialized)
+    _config_dump: tuple[WorkflowConfig, dict[str, Any]] | None = PrivateAttr(default=None)
+
     def get_step_output(self, step_id: str) -> Any:
         """Get output from a specific step"""
         return self.step_outputs.get(step_id)
@@ -92,7 +148,7 @@ class ExecutionContext(BaseModel):
         context = {
             "input": self.input_data,
             "steps": self.step_outputs,
-            "config": self.config.model_dump(),
+            "config": self._get_config_dump(),
             "workflow": {"name": self.workflow_name},
         }
 
@@ -101,6 +157,18 @@ class ExecutionContext(BaseModel):
 
         return context
 
+    def _get_config_dump(self) -> dict[str, Any]:
+        """Get the dumped config, dumping again only when the config is replaced
+
+        The config does not change during execution, so one model_dump() serves
+        every template render instead of one per render.
+        """
+        cached = self._config_dump
+        if cached is None or cached[0] is not self.config:
+            cached = (self.config, self.config.model_dump())
+            self._config_dump = cached
+        return cached[1]
+
     def render_template(self, template: str) -> str:
         """Render template with current execution context"""
         return self._template_engine.render(template, self.get_template_context())
@@ -109,6 +177,10 @@ class ExecutionContext(BaseModel):
         """Render template and return the actual object (not string representation)"""
         return self._template_engine.render_object(template, self.get_template_context())
 
+    def render_condition(self, template: str) -> Any:
+        """Render a condition template to a native Python value"""
+        return self._template_engine.render_condition(template, self.get_template_context())
+
     def validate_template(self, template: str) -> tuple[bool, str]:
         """Validate template syntax"""
         return self._template_engine.validate_template(template)
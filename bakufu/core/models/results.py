@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CollectionResult:
     """Result of a collection operation"""
 
@@ -26,7 +26,7 @@ class CollectionResult:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConditionalResult:
     """Result of a conditional step execution"""
 
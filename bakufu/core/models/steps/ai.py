@@ -4,16 +4,39 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from ...base_types import WorkflowStep
+from ...exceptions import ErrorContext, StepExecutionError, TemplateError
 from ...step_registry import step_type
 
+# ai_provider (litellm) and validation (jsonschema) are heavy to import, so they are
+# still imported on first use rather than when workflow models are loaded
 if TYPE_CHECKING:
-    from ...ai_provider import AIProviderConfig, BaseAIProvider
+    from ...ai_provider import AIProviderConfig, AIResponse, AIResponseCache, BaseAIProvider
     from ...models import ExecutionContext
     from ...validation import OutputValidator
 
+# Static suggestions attached to step errors
+_AI_PROVIDER_SUGGESTIONS = (
+    "Check AI provider configuration",
+    "Verify API keys",
+    "Check network connectivity",
+)
+_AI_CALL_SUGGESTIONS = (
+    "Check AI provider configuration",
+    "Verify network connectivity",
+    "Check input prompt format",
+)
+_VALIDATION_SUGGESTIONS = (
+    "Check validation configuration",
+    "Verify JSON schema format",
+    "Check custom validation function",
+)
+
+# Errors worth another validation attempt (asyncio.TimeoutError is TimeoutError)
+_TRANSIENT_ERRORS = (TimeoutError, ConnectionError)
+
 
 @step_type("ai_call")
 class AICallStep(WorkflowStep):
@@ -40,23 +63,36 @@ class AICallStep(WorkflowStep):
     # Validation configuration
     validation: dict[str, Any] | None = Field(None, description="Output validation configuration")
 
-    async def execute(self, context: Any) -> Any:
-        """Execute AI call step directly using Command Pattern"""
-        from typing import cast
+    cacheable: bool = Field(
+        default=False,
+        description=(
+            "Reuse the response for identical rendered prompts within the same run. "
+            "Only enable for deterministic calls."
+        ),
+    )
 
+    # Validator paired with the validation config it was built from (not serialized)
+    _validator: tuple[dict[str, Any], OutputValidator] | None = PrivateAttr(default=None)
+
+    async def execute(
+        self,
+        context: ExecutionContext,
+        provider_cache: dict[str, BaseAIProvider] | None = None,
+        response_cache: AIResponseCache | None = None,
+    ) -> Any:
+        """Execute AI call step directly using Command Pattern
+
+        Args:
+            context: Execution context
+            provider_cache: Optional cache of providers keyed by their configuration,
+                shared by the execution engine so repeated calls reuse one provider
+            response_cache: Optional response cache used when the step is cacheable
+        """
         from ...ai_provider import (
             AIProvider,
             AIProviderError,
             MCPSamplingProvider,
         )
-        from ...exceptions import (
-            ErrorContext,
-            StepExecutionError,
-            TemplateError,
-        )
-        from ...models import ExecutionContext
-
-        context = cast(ExecutionContext, context)
 
         # Render prompt template
         try:
@@ -83,18 +119,23 @@ class AICallStep(WorkflowStep):
             ai_provider: BaseAIProvider
             if context.sampling_mode and context.mcp_context:
                 ai_provider = MCPSamplingProvider(context.mcp_context, provider_config)
+            elif provider_cache is not None:
+                cache_key = provider_config.model_dump_json()
+                if cache_key not in provider_cache:
+                    provider_cache[cache_key] = AIProvider(provider_config)
+                ai_provider = provider_cache[cache_key]
             else:
                 ai_provider = AIProvider(provider_config)
 
             # Handle validation if specified
             if self.validation:
                 return await self._execute_ai_call_with_validation(
-                    ai_provider, rendered_prompt, context
+                    ai_provider, rendered_prompt, context, response_cache
                 )
             else:
-                response = await ai_provider.complete(rendered_prompt)
-                # Add usage information to context
-                context.add_step_usage(self.id, response.usage, response.cost_usd)
+                response = await self._complete(
+                    ai_provider, rendered_prompt, context, response_cache
+                )
                 return response.content
         except AIProviderError as e:
             # AI provider errors are already well-structured
@@ -103,11 +144,7 @@ class AICallStep(WorkflowStep):
                 step_id=self.id,
                 context=ErrorContext(step_id=self.id, function_name="execute"),
                 original_error=e,
-                suggestions=[
-                    "Check AI provider configuration",
-                    "Verify API keys",
-                    "Check network connectivity",
-                ],
+                suggestions=_AI_PROVIDER_SUGGESTIONS,
             ) from e
         except Exception as e:
             raise StepExecutionError(
@@ -115,39 +152,58 @@ class AICallStep(WorkflowStep):
                 step_id=self.id,
                 context=ErrorContext(step_id=self.id, function_name="execute"),
                 original_error=e,
-                suggestions=[
-                    "Check AI provider configuration",
-                    "Verify network connectivity",
-                    "Check input prompt format",
-                ],
+                suggestions=_AI_CALL_SUGGESTIONS,
             ) from e
 
     def _build_ai_provider_config(self, context: ExecutionContext) -> AIProviderConfig:
         """Build AI provider configuration from step and context."""
         from ...ai_provider import AIProviderConfig
 
-        provider_config = AIProviderConfig(
-            provider=self.provider or context.config.default_provider,
+        provider = self.provider or context.config.default_provider
+
+        # Merge provider-specific settings and step-level ai_params (which take
+        # precedence) into one dict, instead of updating the config's copy twice
+        provider_name = provider.partition("/")[0]
+        provider_settings = context.config.provider_settings.get(provider_name, {})
+        extra_params = {**provider_settings, **self.ai_params}
+
+        # Every value below was already validated by this step or the WorkflowConfig
+        # under the same constraints, so skip validating them again on each call
+        provider_config = AIProviderConfig.model_construct(
+            provider=provider,
             temperature=self.temperature if self.temperature is not None else 0.7,
             max_tokens=self.max_tokens,
             timeout=context.config.timeout_per_step,
             max_retries=3,
+            extra_params=extra_params,
         )
+        return provider_config
 
-        # Apply provider-specific settings if available
-        provider_name = (
-            provider_config.provider.split("/")[0]
-            if "/" in provider_config.provider
-            else provider_config.provider
-        )
-        if provider_name in context.config.provider_settings:
-            provider_config.extra_params.update(context.config.provider_settings[provider_name])  # type: ignore[typeddict-item]
+    async def _complete(
+        self,
+        ai_provider: BaseAIProvider,
+        prompt: str,
+        context: ExecutionContext,
+        response_cache: AIResponseCache | None,
+    ) -> AIResponse:
+        """Request a completion and record its usage
 
-        # Apply step-level ai_params (takes precedence over provider settings)
-        if hasattr(self, "ai_params") and getattr(self, "ai_params", None):
-            provider_config.extra_params.update(getattr(self, "ai_params", {}))  # type: ignore[typeddict-item]
+        Cacheable steps serve identical prompts from the response cache, and
+        concurrent identical requests share a single API call. Only the call that
+        actually reaches the provider records usage.
+        """
 
-        return provider_config
+        async def request() -> AIResponse:
+            response = await ai_provider.complete(prompt)
+            # Add usage information to context
+            context.add_step_usage(self.id, response.usage, response.cost_usd)
+            return response
+
+        if self.cacheable and response_cache is not None:
+            cache_key = response_cache.make_key(ai_provider.config, prompt)
+            return await response_cache.get_or_complete(cache_key, request)
+
+        return await request()
 
     def _prepare_retry_prompt(
         self, original_prompt: str, validator: OutputValidator, validation_result: Any
@@ -156,18 +212,35 @@ class AICallStep(WorkflowStep):
         retry_prompt_suffix = validator.get_retry_prompt(validation_result)
         return f"{original_prompt}\n\n{retry_prompt_suffix}"
 
+    def _get_validator(self, validation: dict[str, Any]) -> OutputValidator:
+        """Get the output validator, building it again only when the config is replaced
+
+        Building the validator parses the config and resolves schemas, models or
+        functions, so one validator serves every call of this step.
+        """
+        from ...validation import OutputValidator, ValidationConfig
+
+        cached = self._validator
+        if cached is None or cached[0] is not validation:
+            cached = (validation, OutputValidator(ValidationConfig(**validation)))
+            self._validator = cached
+        return cached[1]
+
     async def _execute_ai_call_with_validation(
-        self, ai_provider: BaseAIProvider, prompt: str, context: ExecutionContext
+        self,
+        ai_provider: BaseAIProvider,
+        prompt: str,
+        context: ExecutionContext,
+        response_cache: AIResponseCache | None = None,
     ) -> str:
         """Execute AI call with output validation and retry logic"""
         from ...ai_provider import AIProviderError
-        from ...exceptions import ErrorContext, StepExecutionError
-        from ...validation import OutputValidator, ValidationConfig, ValidationError
+        from ...validation import ValidationError
 
         if self.validation is None:
             raise ValueError("Validation configuration is required")
-        validation_config = ValidationConfig(**self.validation)
-        validator = OutputValidator(validation_config)
+        validator = self._get_validator(self.validation)
+        validation_config = validator.config
 
         original_prompt = prompt
         current_prompt = prompt
@@ -178,10 +251,9 @@ class AICallStep(WorkflowStep):
 
         for attempt in range(validation_config.max_retries + 1):
             try:
-                response = await ai_provider.complete(current_prompt)
-
-                # Add usage information to context
-                context.add_step_usage(self.id, response.usage, response.cost_usd)
+                response = await self._complete(
+                    ai_provider, current_prompt, context, response_cache
+                )
 
                 # Validate the response
                 validation_result = validator.validate(response.content, attempt + 1)
@@ -207,7 +279,8 @@ class AICallStep(WorkflowStep):
             except ValidationError:
                 raise
             except AIProviderError as e:
-                # Re-raise AI provider errors as-is
+                # The provider already retried with backoff, so another attempt would
+                # only repeat paid calls
                 raise StepExecutionError(
                     message=f"AI provider error during validation attempt {attempt + 1}: {e!s}",
                     step_id=self.id,
@@ -215,29 +288,21 @@ class AICallStep(WorkflowStep):
                         step_id=self.id, function_name="_execute_ai_call_with_validation"
                     ),
                     original_error=e,
-                    suggestions=[
-                        "Check AI provider configuration",
-                        "Verify API keys",
-                        "Check network connectivity",
-                    ],
+                    suggestions=_AI_PROVIDER_SUGGESTIONS,
                 ) from e
             except Exception as e:
-                if attempt < validation_config.max_retries:
+                # Only transient failures can succeed on another (paid) attempt
+                if isinstance(e, _TRANSIENT_ERRORS) and attempt < validation_config.max_retries:
                     continue
-                else:
-                    raise StepExecutionError(
-                        message=f"Unexpected error during validated AI call: {e}",
-                        step_id=self.id,
-                        context=ErrorContext(
-                            step_id=self.id, function_name="_execute_ai_call_with_validation"
-                        ),
-                        original_error=e,
-                        suggestions=[
-                            "Check validation configuration",
-                            "Verify JSON schema format",
-                            "Check custom validation function",
-                        ],
-                    ) from e
+                raise StepExecutionError(
+                    message=f"Unexpected error during validated AI call: {e}",
+                    step_id=self.id,
+                    context=ErrorContext(
+                        step_id=self.id, function_name="_execute_ai_call_with_validation"
+                    ),
+                    original_error=e,
+                    suggestions=_VALIDATION_SUGGESTIONS,
+                ) from e
 
         # This should never be reached
         raise RuntimeError("Validation loop completed without returning a result")
@@ -1,15 +1,19 @@
 """Collection operation step models for Bakufu workflows"""
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from ...base_types import WorkflowStep
+from ...collection_processors import CollectionProcessor
+from ...exceptions import ErrorContext, StepExecutionError, TemplateError
 from ...step_registry import step_type
 
 # Import for type hints only to avoid circular imports
 if TYPE_CHECKING:
     from ...text_steps import AnyTextProcessStep
+    from ..execution import ExecutionContext
     from .ai import AICallStep
 
 
@@ -43,21 +47,11 @@ class CollectionStep(WorkflowStep):
         None, description="Concurrency settings for parallel operations"
     )
 
-    async def execute(self, context: Any) -> Any:
-        """Execute collection step directly using Command Pattern"""
-        from collections.abc import Callable
-        from typing import cast
-
-        from ...collection_processors import CollectionProcessor
-        from ...exceptions import (
-            ErrorContext,
-            StepExecutionError,
-            TemplateError,
-        )
-        from ...models import ExecutionContext
-
-        context = cast(ExecutionContext, context)
+    # Processor reused across executions of this step (it keeps no per-call state)
+    _processor: CollectionProcessor | None = PrivateAttr(default=None)
 
+    async def execute(self, context: "ExecutionContext") -> Any:
+        """Execute collection step directly using Command Pattern"""
         # Render input template to get the collection
         input_attr = getattr(self, "input", None)
         if not input_attr:
@@ -85,11 +79,12 @@ class CollectionStep(WorkflowStep):
 
         # Create and execute collection processor
         try:
-            # Note: progress_callback is not available at step level,
-            # could be added in future if needed
-            progress_callback: Callable | None = None
-            processor = CollectionProcessor(self, progress_callback)
-            result = await processor.process(input_data, context)
+            if self._processor is None:
+                # Note: progress_callback is not available at step level,
+                # could be added in future if needed
+                progress_callback: Callable | None = None
+                self._processor = CollectionProcessor(self, progress_callback)
+            result = await self._processor.process(input_data, context)
 
             # Return the output, but store the full CollectionResult for debugging
             # For now, we return just the output to maintain compatibility
@@ -2,21 +2,44 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Sequence
+import asyncio
+from collections.abc import Callable, Coroutine, Sequence
 from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
-from ...base_types import WorkflowStep
+from ...base_types import ErrorAction, WorkflowStep, validate_sequential_dependencies
+from ...exceptions import ErrorContext, StepExecutionError, TemplateError
 from ...step_registry import step_type
+from ...template_engine import TemplateRenderError, get_shared_template_engine
+from ..results import ConditionalResult
 
 # Import for type hints only to avoid circular imports
 if TYPE_CHECKING:
-    from ...models import ConditionalResult, ExecutionContext
+    from ...models import ExecutionContext
     from ..base import AnyWorkflowStep
 
     # Type alias for step executor function
-    StepExecutor = Callable[[WorkflowStep, ExecutionContext], Awaitable[Any]]
+    StepExecutor = Callable[[WorkflowStep, ExecutionContext], Coroutine[Any, Any, Any]]
+
+# Rendered condition strings (lowercased) that count as true
+_TRUTHY_STRINGS = frozenset({"true", "1", "yes"})
+# Common spellings of those, matched as-is before normalizing the string
+_TRUTHY_EXACT = _TRUTHY_STRINGS | {"True", "TRUE", "Yes", "YES"}
+
+# Conditions containing none of these are plain text and always evaluate the same way
+_TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+
+def _condition_result_to_bool(condition_result_raw: Any) -> bool:
+    """Interpret a rendered condition as a boolean"""
+    # Literals (True, 0, [] ...) are already native values; other text stays a string
+    if isinstance(condition_result_raw, str):
+        return (
+            condition_result_raw in _TRUTHY_EXACT
+            or condition_result_raw.strip().lower() in _TRUTHY_STRINGS
+        )
+    return bool(condition_result_raw)
 
 
 class ConditionalBranch(BaseModel):
@@ -26,6 +49,17 @@ class ConditionalBranch(BaseModel):
     name: str = Field(..., description="Branch name for identification")
     steps: list[AnyWorkflowStep] = Field(..., description="Steps to execute in this branch")
     default: bool = Field(default=False, description="Whether this is the default branch")
+    parallel: bool = Field(
+        default=False,
+        description="Run the branch steps concurrently (ignored if any step uses depends_on)",
+    )
+
+    @field_validator("steps")
+    @classmethod
+    def validate_step_dependencies(cls, v: list[AnyWorkflowStep]) -> list[AnyWorkflowStep]:
+        # Branch steps using depends_on always run in declaration order
+        validate_sequential_dependencies(v)
+        return v
 
     def model_post_init(self, __context: Any) -> None:
         """Validate condition requirements after all fields are set"""
@@ -61,10 +95,18 @@ class ConditionalStep(WorkflowStep):
     )
 
     # Error handling
-    on_condition_error: Literal["stop", "continue", "skip_remaining"] = Field(
-        default="stop", description="Action when condition evaluation fails"
+    on_condition_error: ErrorAction = Field(
+        default=ErrorAction.STOP, description="Action when condition evaluation fails"
     )
 
+    # Multi-branch layout resolved once: the branches whose conditions are evaluated
+    # (those before the default branch) and the default branch itself
+    _condition_branches: tuple[ConditionalBranch, ...] = PrivateAttr(default=())
+    _default_branch: ConditionalBranch | None = PrivateAttr(default=None)
+
+    # Results of conditions that contain no template syntax, keyed by condition
+    _constant_conditions: dict[str, bool] = PrivateAttr(default_factory=dict)
+
     @field_validator("conditions")
     @classmethod
     def validate_conditions_structure(
@@ -73,10 +115,12 @@ class ConditionalStep(WorkflowStep):
         if v is None:
             return v
 
-        # Check for duplicate names
-        names = [branch.name for branch in v]
-        if len(names) != len(set(names)):
-            raise ValueError("Branch names must be unique")
+        # Check for duplicate names, stopping at the first repeat
+        seen: set[str] = set()
+        for branch in v:
+            if branch.name in seen:
+                raise ValueError("Branch names must be unique")
+            seen.add(branch.name)
 
         # Check for multiple default branches
         default_count = sum(1 for branch in v if branch.default)
@@ -85,6 +129,16 @@ class ConditionalStep(WorkflowStep):
 
         return v
 
+    @field_validator("if_true", "if_false")
+    @classmethod
+    def validate_step_dependencies(
+        cls, v: list[AnyWorkflowStep] | None
+    ) -> list[AnyWorkflowStep] | None:
+        # Branch steps using depends_on always run in declaration order
+        if v is not None:
+            validate_sequential_dependencies(v)
+        return v
+
     @field_validator("condition")
     @classmethod
     def validate_simple_condition(cls, v: str | None, info: Any) -> str | None:
@@ -108,24 +162,39 @@ class ConditionalStep(WorkflowStep):
         if has_basic and self.if_true is None:
             raise ValueError("'if_true' steps must be provided for basic conditional structure")
 
-    async def execute(self, context: Any, step_executor: StepExecutor | None = None) -> Any:
+        # A default branch ends evaluation, so branches after it are never reached
+        condition_branches: list[ConditionalBranch] = []
+        for branch in self.conditions or []:
+            if branch.default:
+                self._default_branch = branch
+                break
+            condition_branches.append(branch)
+        self._condition_branches = tuple(condition_branches)
+
+        # Plain-text conditions do not depend on the context, so evaluate them once
+        conditions = [branch.condition for branch in condition_branches]
+        if self.condition is not None:
+            conditions.append(self.condition)
+        engine = None
+        for condition in conditions:
+            if any(marker in condition for marker in _TEMPLATE_MARKERS):
+                continue
+            engine = engine or get_shared_template_engine()
+            try:
+                result = engine.render_condition(condition, {})
+            except TemplateRenderError:
+                continue  # Left to fail (and be handled) at execution time
+            self._constant_conditions[condition] = _condition_result_to_bool(result)
+
+    async def execute(
+        self, context: ExecutionContext, step_executor: StepExecutor | None = None
+    ) -> Any:
         """Execute conditional step directly using Command Pattern
 
         Args:
             context: Execution context
             step_executor: Function to execute nested steps (to avoid circular import)
         """
-        from typing import cast
-
-        from ...exceptions import (
-            ErrorContext,
-            StepExecutionError,
-            TemplateError,
-        )
-        from ...models import ExecutionContext
-
-        context = cast(ExecutionContext, context)
-
         if step_executor is None:
             raise RuntimeError(
                 "step_executor not provided - ConditionalStep needs a step executor for nested steps"
@@ -161,12 +230,17 @@ class ConditionalStep(WorkflowStep):
                 ],
             ) from e
 
+    def _evaluate_condition(self, condition: str, context: ExecutionContext) -> bool:
+        """Render a condition template and interpret the result as a boolean"""
+        constant_result = self._constant_conditions.get(condition)
+        if constant_result is not None:
+            return constant_result
+        return _condition_result_to_bool(context.render_condition(condition))
+
     async def _execute_basic_conditional(
         self, context: ExecutionContext, step_executor: StepExecutor
     ) -> ConditionalResult:
         """Execute basic if-else conditional structure"""
-        from ...models import ConditionalResult
-
         condition_result = None
         evaluation_error = None
         executed_branch = None
@@ -174,19 +248,11 @@ class ConditionalStep(WorkflowStep):
 
         # Evaluate condition
         try:
-            condition_result_raw = context.render_template_object(self.condition or "")
-            # Handle different types that Jinja2 might return
-            if isinstance(condition_result_raw, str):
-                # If it's a string representation, evaluate it as Python expression
-                condition_result = condition_result_raw.lower() in ("true", "1", "yes")
-            else:
-                condition_result = bool(condition_result_raw)
+            condition_result = self._evaluate_condition(self.condition or "", context)
         except Exception as e:
             evaluation_error = str(e)
             # Handle condition evaluation error based on configuration
-            if self.on_condition_error == "stop":
-                from ...exceptions import ErrorContext, TemplateError
-
+            if self.on_condition_error is ErrorAction.STOP:
                 raise TemplateError(
                     message=f"Condition evaluation failed: {e}",
                     template_content=self.condition or "",
@@ -201,10 +267,10 @@ class ConditionalStep(WorkflowStep):
                         f"Condition: {self.condition}",
                     ],
                 ) from e
-            elif self.on_condition_error == "continue":
+            elif self.on_condition_error is ErrorAction.CONTINUE:
                 # Treat as false and continue
                 condition_result = False
-            elif self.on_condition_error == "skip_remaining":
+            elif self.on_condition_error is ErrorAction.SKIP_REMAINING:
                 # Return empty result
                 return ConditionalResult(
                     output=None,
@@ -224,9 +290,9 @@ class ConditionalStep(WorkflowStep):
             # If no matching branch, output remains None
         except Exception:
             # Handle execution errors in branches based on parent step's on_error setting
-            if self.on_error == "stop":
+            if self.on_error is ErrorAction.STOP:
                 raise
-            elif self.on_error in {"continue", "skip_remaining"}:
+            elif self.on_error in (ErrorAction.CONTINUE, ErrorAction.SKIP_REMAINING):
                 output = None
 
         return ConditionalResult(
@@ -240,67 +306,60 @@ class ConditionalStep(WorkflowStep):
         self, context: ExecutionContext, step_executor: StepExecutor
     ) -> ConditionalResult:
         """Execute multi-branch conditional structure"""
-        from ...exceptions import ErrorContext, TemplateError
-        from ...models import ConditionalResult
-
         condition_result = None
         evaluation_error = None
         executed_branch = None
         output = None
 
         # Evaluate conditions in order until one matches
-        for branch in self.conditions or []:
-            if branch.default:
-                # Default branch - execute if no other branch matched
-                if executed_branch is None:
+        for branch in self._condition_branches:
+            try:
+                condition_result = self._evaluate_condition(branch.condition, context)
+
+                if condition_result:
                     executed_branch = branch.name
-                    output = await self._execute_step_list(branch.steps, context, step_executor)
-                    condition_result = True  # Default branch is considered "true"
-                break
-            else:
-                # Regular condition branch
-                try:
-                    condition_result_raw = context.render_template_object(branch.condition)
-                    # Handle different types that Jinja2 might return
-                    if isinstance(condition_result_raw, str):
-                        # If it's a string representation, evaluate it as Python expression
-                        condition_result = condition_result_raw.lower() in ("true", "1", "yes")
-                    else:
-                        condition_result = bool(condition_result_raw)
-
-                    if condition_result:
-                        executed_branch = branch.name
-                        output = await self._execute_step_list(branch.steps, context, step_executor)
-                        break
-                except Exception as e:
-                    evaluation_error = str(e)
-                    # Handle condition evaluation error
-                    if self.on_condition_error == "stop":
-                        raise TemplateError(
-                            message=f"Branch '{branch.name}' condition evaluation failed: {e}",
-                            template_content=branch.condition,
-                            line_number=getattr(e, "lineno", None),
-                            context=ErrorContext(
-                                step_id=self.id, function_name="_execute_multi_branch_conditional"
-                            ),
-                            original_error=e,
-                            suggestions=[
-                                "Check branch condition template syntax",
-                                "Verify all variables are available in context",
-                                f"Branch: {branch.name}, Condition: {branch.condition}",
-                            ],
-                        ) from e
-                    elif self.on_condition_error == "continue":
-                        # Skip this branch and continue to next
-                        continue
-                    elif self.on_condition_error == "skip_remaining":
-                        # Return empty result
-                        return ConditionalResult(
-                            output=None,
-                            condition_result=None,
-                            executed_branch=None,
-                            evaluation_error=evaluation_error,
-                        )
+                    output = await self._execute_step_list(
+                        branch.steps, context, step_executor, parallel=branch.parallel
+                    )
+                    break
+            except Exception as e:
+                evaluation_error = str(e)
+                # Handle condition evaluation error
+                if self.on_condition_error is ErrorAction.STOP:
+                    raise TemplateError(
+                        message=f"Branch '{branch.name}' condition evaluation failed: {e}",
+                        template_content=branch.condition,
+                        line_number=getattr(e, "lineno", None),
+                        context=ErrorContext(
+                            step_id=self.id, function_name="_execute_multi_branch_conditional"
+                        ),
+                        original_error=e,
+                        suggestions=[
+                            "Check branch condition template syntax",
+                            "Verify all variables are available in context",
+                            f"Branch: {branch.name}, Condition: {branch.condition}",
+                        ],
+                    ) from e
+                elif self.on_condition_error is ErrorAction.CONTINUE:
+                    # Skip this branch and continue to next
+                    continue
+                elif self.on_condition_error is ErrorAction.SKIP_REMAINING:
+                    # Return empty result
+                    return ConditionalResult(
+                        output=None,
+                        condition_result=None,
+                        executed_branch=None,
+                        evaluation_error=evaluation_error,
+                    )
+
+        # Default branch - execute if no other branch matched
+        default_branch = self._default_branch
+        if executed_branch is None and default_branch is not None:
+            executed_branch = default_branch.name
+            output = await self._execute_step_list(
+                default_branch.steps, context, step_executor, parallel=default_branch.parallel
+            )
+            condition_result = True  # Default branch is considered "true"
 
         # If no branch was executed, set condition_result to None for multi-branch
         if executed_branch is None and not evaluation_error:
@@ -318,6 +377,7 @@ class ConditionalStep(WorkflowStep):
         steps: Sequence[WorkflowStep],
         context: ExecutionContext,
         step_executor: StepExecutor | None,
+        parallel: bool = False,
     ) -> Any:
         """Execute a list of steps and return the output of the last step"""
         if step_executor is None:
@@ -325,11 +385,38 @@ class ConditionalStep(WorkflowStep):
                 "step_executor not provided - ConditionalStep needs a step executor for nested steps"
             )
 
+        # Branches usually hold a single step; run it without loop or task group setup
+        if len(steps) == 1:
+            step = steps[0]
+            last_output = await step_executor(step, context)
+            context.set_step_output(step.id, last_output)
+            return last_output
+
         last_output = None
 
+        if parallel and not any(step.depends_on for step in steps):
+            # The first failure cancels the remaining steps of the list
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [task_group.create_task(step_executor(step, context)) for step in steps]
+            except BaseExceptionGroup:
+                pass  # The first failure in declaration order is re-raised below
+
+            # Record outputs in declaration order, failing on the first error like sequential runs
+            for step, task in zip(steps, tasks, strict=True):
+                if task.cancelled():
+                    continue
+                error = task.exception()
+                if error is not None:
+                    raise error
+                last_output = task.result()
+                context.set_step_output(step.id, last_output)
+            return last_output
+
+        set_step_output = context.set_step_output
         for step in steps:
             result = await step_executor(step, context)
-            context.set_step_output(step.id, result)
+            set_step_output(step.id, result)
             last_output = result
 
         return last_output
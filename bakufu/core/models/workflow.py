@@ -1,11 +1,16 @@
 """Workflow definition and configuration models for Bakufu"""
 
+import string
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from ..base_types import validate_sequential_dependencies
 from .base import AnyWorkflowStep, InputParameter, OutputFormat
 
+# Characters allowed in workflow names (ASCII letters, digits, hyphen, underscore, space)
+_ALLOWED_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "-_ ")
+
 
 class Workflow(BaseModel):
     """Complete workflow definition"""
@@ -18,8 +23,6 @@ class Workflow(BaseModel):
     @classmethod
     def validate_name_format(cls, v: str) -> str:
         """Validate workflow name to prevent MCP tool name conflicts"""
-        import string
-
         if not v:
             raise ValueError("Workflow name cannot be empty")
 
@@ -29,8 +32,7 @@ class Workflow(BaseModel):
 
         # Check if name contains only ASCII letters, numbers, hyphens, underscores, and spaces
         # This prevents Japanese characters while allowing existing naming patterns
-        allowed_chars = string.ascii_letters + string.digits + "-_ "
-        if not all(c in allowed_chars for c in v):
+        if not _ALLOWED_NAME_CHARS.issuperset(v):
             raise ValueError(
                 "Workflow name must contain only ASCII letters, numbers, hyphens, underscores, and spaces"
             )
@@ -44,15 +46,72 @@ class Workflow(BaseModel):
     input_parameters: list[InputParameter] | None = Field(default_factory=list)
     steps: list[AnyWorkflowStep] = Field(..., min_length=1)
     output: OutputFormat | None = None
+    parallel: bool = Field(
+        default=False,
+        description="Run independent top-level steps concurrently, ordered by 'depends_on'",
+    )
 
     @field_validator("steps")
     @classmethod
     def validate_step_ids_unique(cls, v: list[AnyWorkflowStep]) -> list[AnyWorkflowStep]:
-        step_ids = [step.id for step in v]
-        if len(step_ids) != len(set(step_ids)):
-            raise ValueError("Step IDs must be unique")
+        seen: set[str] = set()
+        for step in v:
+            if step.id in seen:
+                raise ValueError("Step IDs must be unique")
+            seen.add(step.id)
         return v
 
+    @field_validator("steps")
+    @classmethod
+    def validate_step_dependencies(cls, v: list[AnyWorkflowStep]) -> list[AnyWorkflowStep]:
+        # Raises ValueError for unknown or cyclic dependencies
+        build_execution_levels(v)
+        return v
+
+    @field_validator("parallel")
+    @classmethod
+    def validate_sequential_order(cls, v: bool, info: Any) -> bool:
+        # Sequential workflows run in declaration order, which must satisfy 'depends_on'
+        steps = info.data.get("steps")
+        if not v and steps is not None:
+            validate_sequential_dependencies(steps)
+        return v
+
+    def get_execution_levels(self) -> list[list[AnyWorkflowStep]]:
+        """Group steps into levels that can each be executed concurrently"""
+        return build_execution_levels(self.steps)
+
+
+def build_execution_levels(steps: list[AnyWorkflowStep]) -> list[list[AnyWorkflowStep]]:
+    """Group steps into dependency levels (Kahn's algorithm)
+
+    Each level only depends on steps from earlier levels. Steps keep their
+    declaration order within a level.
+    """
+    step_ids = {step.id for step in steps}
+    remaining: dict[str, set[str]] = {}
+    for step in steps:
+        for dependency in step.depends_on:
+            if dependency == step.id:
+                raise ValueError(f"Step '{step.id}' cannot depend on itself")
+            if dependency not in step_ids:
+                raise ValueError(f"Step '{step.id}' depends on unknown step '{dependency}'")
+        remaining[step.id] = set(step.depends_on)
+
+    levels: list[list[AnyWorkflowStep]] = []
+    pending = list(steps)
+    while pending:
+        level = [step for step in pending if not remaining[step.id]]
+        if not level:
+            cycle = ", ".join(step.id for step in pending)
+            raise ValueError(f"Circular step dependencies detected among: {cycle}")
+        levels.append(level)
+        done = {step.id for step in level}
+        pending = [step for step in pending if step.id not in done]
+        for step in pending:
+            remaining[step.id] -= done
+    return levels
+
 
 class WorkflowConfig(BaseModel):
     """Workflow execution configuration"""
@@ -82,9 +141,15 @@ class WorkflowConfig(BaseModel):
         if not isinstance(bakufu_config, BakufuConfig):
             raise TypeError("Expected BakufuConfig instance")
 
+        # ProviderConfig only holds scalar fields, so reading the attributes directly
+        # matches model_dump(exclude_none=True) without running the serializer
         provider_settings = {}
         for provider_name, provider_config in bakufu_config.provider_settings.items():
-            provider_settings[provider_name] = provider_config.model_dump(exclude_none=True)
+            provider_settings[provider_name] = {
+                name: value
+                for name in type(provider_config).model_fields
+                if (value := getattr(provider_config, name)) is not None
+            }
 
         return cls(
             default_provider=bakufu_config.default_provider,
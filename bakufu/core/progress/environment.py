@@ -3,6 +3,20 @@
 import os
 import sys
 from enum import Enum
+from functools import lru_cache
+
+# Environment variables set by common CI/CD services
+_CI_INDICATORS = (
+    "CI",
+    "CONTINUOUS_INTEGRATION",
+    "GITHUB_ACTIONS",
+    "GITLAB_CI",
+    "JENKINS_URL",
+    "TRAVIS",
+    "CIRCLECI",
+    "BUILDKITE",
+    "TEAMCITY_VERSION",
+)
 
 
 class EnvironmentType(Enum):
@@ -15,26 +29,20 @@ class EnvironmentType(Enum):
 
 def detect_environment() -> EnvironmentType:
     """Detect the current execution environment."""
-    # Check for test environment
-    if "pytest" in sys.modules or "unittest" in sys.modules:
+    # Check for test environment (pytest sets PYTEST_CURRENT_TEST while running a test;
+    # plain "unittest" is imported by many unrelated libraries, its runner is not)
+    if os.environ.get("PYTEST_CURRENT_TEST") is not None or "unittest.runner" in sys.modules:
         return EnvironmentType.TEST
 
+    return _detect_runtime_environment()
+
+
+@lru_cache(maxsize=1)
+def _detect_runtime_environment() -> EnvironmentType:
+    """Detect CI/CD or interactive use; these do not change while the process runs."""
     # Check for CI/CD environments
-    ci_indicators = [
-        "CI",
-        "CONTINUOUS_INTEGRATION",
-        "GITHUB_ACTIONS",
-        "GITLAB_CI",
-        "JENKINS_URL",
-        "TRAVIS",
-        "CIRCLECI",
-        "BUILDKITE",
-        "TEAMCITY_VERSION",
-    ]
-
-    for indicator in ci_indicators:
-        if os.getenv(indicator):
-            return EnvironmentType.CI_CD
+    if any(os.getenv(indicator) for indicator in _CI_INDICATORS):
+        return EnvironmentType.CI_CD
 
     # Check if stdout is connected to a terminal
     if not sys.stdout.isatty():
@@ -74,7 +74,7 @@ class ProgressManager:
             current_step_name="",
             current_step_type="",
             total_errors=0,
-            start_time=time.time(),
+            start_time=time.monotonic(),
             status=ProgressStatus.RUNNING,
         )
 
@@ -102,7 +102,7 @@ class ProgressManager:
     def finish_workflow(self, success: bool = True) -> None:
         """Finish workflow progress tracking."""
         if self.workflow_data:
-            total_time = time.time() - self.workflow_data.start_time
+            total_time = time.monotonic() - self.workflow_data.start_time
             self.workflow_data.status = (
                 ProgressStatus.COMPLETED if success else ProgressStatus.FAILED
             )
@@ -126,7 +126,7 @@ class ProgressManager:
             progress_percent=0.0,
             current_operation="Starting...",
             errors=0,
-            start_time=time.time(),
+            start_time=time.monotonic(),
             status=ProgressStatus.RUNNING,
         )
 
@@ -152,7 +152,7 @@ class ProgressManager:
     def finish_step(self, success: bool = True, stats: ProgressStats | None = None) -> None:
         """Finish step progress tracking."""
         if self.step_data:
-            total_time = time.time() - self.step_data.start_time
+            total_time = time.monotonic() - self.step_data.start_time
             self.step_data.status = ProgressStatus.COMPLETED if success else ProgressStatus.FAILED
 
             if not self.interactive:
@@ -253,7 +253,7 @@ class ProgressManager:
         if not self.ai_map_data:
             return
 
-        total_time = time.time() - self.ai_map_data.start_time
+        total_time = time.monotonic() - self.ai_map_data.start_time
         self.console.print(
             f"[AI_MAP_CALL] ✅ Completed: "
             f"{self.ai_map_data.completed_items}/{self.ai_map_data.total_items} success "
@@ -13,7 +13,7 @@ class ProgressStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowProgressData:
     """Progress data for overall workflow execution."""
 
@@ -28,7 +28,7 @@ class WorkflowProgressData:
     status: ProgressStatus = ProgressStatus.RUNNING
 
 
-@dataclass
+@dataclass(slots=True)
 class StepProgressData:
     """Progress data for individual step execution."""
 
@@ -44,7 +44,7 @@ class StepProgressData:
     completed_items: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AIMapProgressData:
     """Progress data for AI Map Call execution."""
 
@@ -65,7 +65,7 @@ class AIMapProgressData:
     status: ProgressStatus = ProgressStatus.RUNNING
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressStats:
     """Overall progress statistics."""
 
@@ -78,7 +78,7 @@ class ProgressStats:
     retry_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AIMapUpdateData:
     """Data container for AI Map Call progress updates."""
 
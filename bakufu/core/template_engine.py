@@ -2,10 +2,12 @@
 
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import BaseLoader, Environment, StrictUndefined, TemplateError, meta
+from jinja2 import BaseLoader, Environment, StrictUndefined, Template, TemplateError, meta
+from jinja2.nativetypes import NativeEnvironment
 
 
 class TemplateRenderError(Exception):
@@ -28,27 +30,33 @@ class TemplateRenderError(Exception):
 class WorkflowTemplateEngine:
     """Jinja2 template engine for workflow templates"""
 
+    # Maximum number of compiled templates kept per engine
+    TEMPLATE_CACHE_SIZE = 256
+
     def __init__(self) -> None:
         """Initialize template engine with custom configuration"""
         from datetime import datetime
 
-        self.env = Environment(
+        env_options: dict[str, Any] = {
             # Use custom delimiters to avoid conflicts with common text
-            variable_start_string="{{",
-            variable_end_string="}}",
-            block_start_string="{%",
-            block_end_string="%}",
-            comment_start_string="{#",
-            comment_end_string="#}",
+            "variable_start_string": "{{",
+            "variable_end_string": "}}",
+            "block_start_string": "{%",
+            "block_end_string": "%}",
+            "comment_start_string": "{#",
+            "comment_end_string": "#}",
             # Security settings
-            autoescape=False,  # We're processing prompts, not HTML
-            trim_blocks=True,
-            lstrip_blocks=True,
+            "autoescape": False,  # We're processing prompts, not HTML
+            "trim_blocks": True,
+            "lstrip_blocks": True,
             # Enable extensions
-            extensions=["jinja2.ext.do"],
+            "extensions": ["jinja2.ext.do"],
             # Strict undefined behavior - raise exceptions for undefined variables
-            undefined=StrictUndefined,
-        )
+            "undefined": StrictUndefined,
+        }
+        self.env = Environment(**env_options)
+        # Conditions render to native Python values (e.g. bool) instead of strings
+        self.native_env = NativeEnvironment(**env_options)
 
         # Add custom filters for workflow context
         self.env.filters.update(
@@ -69,10 +77,38 @@ class WorkflowTemplateEngine:
             }
         )
 
+        # Share filters and globals with the native environment
+        self.native_env.filters = self.env.filters
+        self.native_env.globals = self.env.globals
+
+        # Compiled templates keyed by source, so repeated renders skip lexing/parsing
+        self._template_cache: dict[str, Template] = {}
+        self._native_template_cache: dict[str, Template] = {}
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "WorkflowTemplateEngine":
+        """Share the engine between copies - it holds no per-execution state
+
+        Execution contexts are deep-copied per collection item; sharing keeps the
+        compiled template cache (which cannot be deep-copied) effective across items.
+        """
+        return self
+
+    def _get_template(self, template_content: str, native: bool = False) -> Template:
+        """Get the compiled template for the given source, compiling it on first use"""
+        cache = self._native_template_cache if native else self._template_cache
+        template = cache.get(template_content)
+        if template is None:
+            if len(cache) >= self.TEMPLATE_CACHE_SIZE:
+                cache.clear()
+            env = self.native_env if native else self.env
+            template = env.from_string(template_content)
+            cache[template_content] = template
+        return template
+
     def render(self, template_content: str, context: dict[str, Any]) -> str:
         """Render template with given context"""
         try:
-            template = self.env.from_string(template_content)
+            template = self._get_template(template_content)
             return str(template.render(context))
         except TemplateError as e:
             # Extract line number if available
@@ -91,7 +127,7 @@ class WorkflowTemplateEngine:
     def render_object(self, template_content: str, context: dict[str, Any]) -> Any:
         """Render template and return the actual object (not string representation)"""
         try:
-            template = self.env.from_string(template_content)
+            template = self._get_template(template_content)
             result = template.render(context)
 
             # If template is a simple variable reference, return the actual object
@@ -126,6 +162,28 @@ class WorkflowTemplateEngine:
                 template_content=template_content,
             ) from e
 
+    def render_condition(self, template_content: str, context: dict[str, Any]) -> Any:
+        """Render a condition template to a native Python value
+
+        Expressions such as ``{{ score >= 80 }}`` yield ``True``/``False`` directly;
+        output that is not a Python literal is returned as a string.
+        """
+        try:
+            return self._get_template(template_content, native=True).render(context)
+        except TemplateError as e:
+            # Extract line number if available
+            line_number = getattr(e, "lineno", None)
+            raise TemplateRenderError(
+                f"Template rendering failed: {e}",
+                template_content=template_content,
+                line_number=line_number,
+            ) from e
+        except Exception as e:
+            raise TemplateRenderError(
+                f"Unexpected template error: {e}",
+                template_content=template_content,
+            ) from e
+
     def validate_template(self, template_content: str) -> tuple[bool, str]:
         """Validate template syntax without rendering"""
         try:
@@ -232,6 +290,17 @@ class WorkflowTemplateEngine:
         return parsed_items
 
 
+@lru_cache(maxsize=1)
+def get_shared_template_engine() -> WorkflowTemplateEngine:
+    """Get the process-wide template engine
+
+    The engine holds no per-execution state, so sharing one keeps its compiled
+    templates across executions (e.g. repeated MCP tool calls) instead of building
+    new Jinja environments and compiling every template again for each of them.
+    """
+    return WorkflowTemplateEngine()
+
+
 class WorkflowTemplateLoader(BaseLoader):
     """Custom template loader for workflow templates from files"""
 
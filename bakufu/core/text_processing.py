@@ -6,15 +6,112 @@ between input file processing and workflow text processing steps.
 
 import csv
 import json
+import mmap
+import os
 import re
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from io import StringIO
-from typing import Any, Literal
+from typing import Any, BinaryIO, Literal
 
 import yaml
 
 from .exceptions import BakufuError, ErrorContext, StepExecutionError
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator (installed with the "fast" extra)
+    orjson = None  # type: ignore[assignment]
+
+# orjson turns integers beyond 64 bits into floats; such inputs use the json module
+_LONG_INTEGER_RE = re.compile(rb"\d{19}")
+
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_BaseSafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _NoDateLoader(_BaseSafeLoader):  # type: ignore[valid-type,misc]
+    """Safe YAML loader that keeps timestamps as strings for consistency"""
+
+
+def _timestamp_constructor(loader: yaml.SafeLoader, node: yaml.ScalarNode) -> str:
+    return loader.construct_scalar(node)
+
+
+_NoDateLoader.add_constructor("tag:yaml.org,2002:timestamp", _timestamp_constructor)
+
+
+def advise_sequential_read(fd: int, whole_file: bool = False) -> None:
+    """Hint the kernel that a file will be read front to back (best effort).
+
+    With ``whole_file`` the kernel is also asked to start reading all of it ahead
+    of time. Platforms without posix_fadvise (e.g. Windows) are left alone.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if whole_file:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass  # Advice only; unsupported file types simply don't get it
+
+
+# Inputs at least this large are parsed from a memory map instead of a read() copy
+MMAP_THRESHOLD = 1 << 20
+
+
+@contextmanager
+def file_buffer(f: BinaryIO, size: int | None = None) -> Iterator[bytes | memoryview]:
+    """Yield the whole contents of a binary file, memory-mapped when it is large.
+
+    The mapping is only valid inside the ``with`` block; parse or decode it there.
+    """
+    if size is None:
+        size = os.fstat(f.fileno()).st_size
+    if size < MMAP_THRESHOLD:
+        yield f.read()
+        return
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        yield view
+
+
+def _loads_with_orjson(data: bytes | memoryview) -> tuple[bool, Any]:
+    """Parse JSON with orjson, returning (False, None) when the json module must do it"""
+    if _LONG_INTEGER_RE.search(data):
+        return False, None
+    try:
+        return True, orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return False, None
+
+
+def _rows_to_dicts(rows: Iterator[list[str]]) -> list[dict[str, str]]:
+    """Build csv.DictReader-equivalent records from a plain csv.reader.
+
+    The header is read once and well-formed rows are zipped directly; ragged rows
+    keep DictReader's semantics (missing values are None, extras go under None).
+    """
+    headers = next(rows, None)
+    if headers is None:
+        return []
+
+    width = len(headers)
+    result: list[dict[Any, Any]] = []
+    for row in rows:
+        if not row:
+            continue  # DictReader skips blank lines
+        record: dict[Any, Any] = dict(zip(headers, row, strict=False))
+        if len(row) > width:
+            record[None] = row[width:]
+        elif len(row) < width:
+            for key in headers[len(row) :]:
+                record[key] = None
+        result.append(record)
+    return result
+
 
 @dataclass
 class CsvParsingContext:
@@ -59,9 +156,29 @@ class JsonProcessor:
                 raise BakufuError(f"Invalid JSON in {context}: {e}", "INVALID_JSON_FORMAT") from e
 
     @staticmethod
-    def parse_json_file(file_path: str, encoding: str = "utf-8") -> Any:
-        """Parse JSON from file with consistent error handling"""
+    def parse_json_file(
+        file_path: str, encoding: str = "utf-8", contents: bytes | None = None
+    ) -> Any:
+        """Parse JSON from file with consistent error handling
+
+        ``contents`` is the file's complete bytes when the caller has already read
+        them, sparing the fast path a second read.
+        """
+        # orjson only reads UTF-8; anything it rejects (e.g. NaN) is re-parsed by
+        # the json module, which also produces the error message
+        if orjson is not None and encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+            if contents is not None:
+                parsed, result = _loads_with_orjson(contents)
+            else:
+                with open(file_path, "rb") as fb:
+                    advise_sequential_read(fb.fileno(), whole_file=True)
+                    with file_buffer(fb) as data:
+                        parsed, result = _loads_with_orjson(data)
+            if parsed:
+                return result
+
         with open(file_path, encoding=encoding) as f:
+            advise_sequential_read(f.fileno(), whole_file=True)
             try:
                 return json.load(f)
             except json.JSONDecodeError as e:
@@ -79,17 +196,8 @@ class YamlProcessor:
     ) -> Any:
         """Parse YAML from string with consistent error handling"""
         try:
-            # Use a custom loader that doesn't auto-parse dates to maintain consistency
-            class NoDateLoader(yaml.SafeLoader):
-                pass
-
-            # Add a custom constructor for timestamps that returns strings
-            def timestamp_constructor(loader: yaml.Loader, node: yaml.ScalarNode) -> str:
-                return loader.construct_scalar(node)
-
-            NoDateLoader.add_constructor("tag:yaml.org,2002:timestamp", timestamp_constructor)
-
-            return yaml.load(data.strip(), Loader=NoDateLoader)
+            # Use a loader that doesn't auto-parse dates to maintain consistency
+            return yaml.load(data.strip(), Loader=_NoDateLoader)
         except yaml.YAMLError as e:
             if step_id:
                 raise StepExecutionError(
@@ -113,15 +221,10 @@ class YamlProcessor:
     def parse_yaml_file(file_path: str, encoding: str = "utf-8") -> Any:
         """Parse YAML from file with consistent error handling"""
         with open(file_path, encoding=encoding) as f:
+            advise_sequential_read(f.fileno())
             try:
-                # Use a custom loader that doesn't auto-parse dates to maintain consistency
-                class NoDateLoader(yaml.SafeLoader):
-                    pass
-
-                # Remove date/datetime constructors to prevent auto-parsing
-                NoDateLoader.yaml_constructors.pop("tag:yaml.org,2002:timestamp", None)
-
-                return yaml.load(f, Loader=NoDateLoader)
+                # Use a loader that doesn't auto-parse dates to maintain consistency
+                return yaml.load(f, Loader=_NoDateLoader)
             except yaml.YAMLError as e:
                 raise BakufuError(
                     f"Invalid YAML in file '{file_path}': {e}", "INVALID_YAML_FORMAT"
@@ -297,20 +400,31 @@ class CsvProcessor:
 
     @staticmethod
     def parse_csv_file(
-        file_path: str, encoding: str = "utf-8", delimiter: str | None = None
+        file_path: str,
+        encoding: str = "utf-8",
+        delimiter: str | None = None,
+        head: bytes | None = None,
     ) -> list[dict[str, str]]:
-        """Parse CSV from file with delimiter detection"""
+        """Parse CSV from file with delimiter detection
+
+        ``head`` is the file's leading bytes when the caller has already read them;
+        the delimiter is then sniffed from it instead of re-reading the file.
+        """
         with open(file_path, encoding=encoding, newline="") as f:
+            advise_sequential_read(f.fileno())
             try:
                 if delimiter is None:
                     # Auto-detect delimiter
-                    sample = f.read(1024)
-                    f.seek(0)
+                    if head is not None:
+                        # A multi-byte character may be cut at the end of the head
+                        sample = head.decode(encoding, errors="ignore")[:1024]
+                    else:
+                        sample = f.read(1024)
+                        f.seek(0)
                     sniffer = csv.Sniffer()
                     delimiter = sniffer.sniff(sample).delimiter
 
-                reader = csv.DictReader(f, delimiter=delimiter)
-                return list(reader)
+                return _rows_to_dicts(csv.reader(f, delimiter=delimiter))
             except Exception as e:
                 raise BakufuError(
                     f"Error parsing CSV file '{file_path}': {e}", "INVALID_CSV_FORMAT"
@@ -327,9 +441,9 @@ class CsvProcessor:
     def parse_tsv_file(file_path: str, encoding: str = "utf-8") -> list[dict[str, str]]:
         """Parse TSV from file"""
         with open(file_path, encoding=encoding, newline="") as f:
+            advise_sequential_read(f.fileno())
             try:
-                reader = csv.DictReader(f, delimiter="\t")
-                return list(reader)
+                return _rows_to_dicts(csv.reader(f, delimiter="\t"))
             except Exception as e:
                 raise BakufuError(
                     f"Error parsing TSV file '{file_path}': {e}", "INVALID_TSV_FORMAT"
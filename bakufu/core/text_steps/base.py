@@ -1,12 +1,15 @@
 """Base class for text processing steps"""
 
 from abc import ABC, abstractmethod
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import Field
 
 from ..base_types import WorkflowStep
 
+if TYPE_CHECKING:
+    from ..models import ExecutionContext
+
 
 class TextProcessStep(WorkflowStep, ABC):
     """Text processing step with polymorphic behavior"""
@@ -34,18 +37,13 @@ class TextProcessStep(WorkflowStep, ABC):
         """Process the input data and return the result"""
         pass
 
-    async def execute(self, context: Any) -> Any:
+    async def execute(self, context: "ExecutionContext") -> Any:
         """Execute text processing step directly using Command Pattern"""
-        from typing import cast
-
         from ..exceptions import (
             ErrorContext,
             StepExecutionError,
             TemplateError,
         )
-        from ..models import ExecutionContext
-
-        context = cast(ExecutionContext, context)
 
         # Render input template
         try:
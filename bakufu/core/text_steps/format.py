@@ -35,14 +35,14 @@ class FormatStep(TextProcessStep):
         The input_data is available as 'input' in the template context.
         """
         # Import here to avoid circular imports during module loading
-        from ..template_engine import TemplateRenderError, WorkflowTemplateEngine
+        from ..template_engine import TemplateRenderError, get_shared_template_engine
 
         try:
-            # Create a template engine instance
+            # Use the shared template engine instance
             # Note: In the actual execution, this will use the context's template engine
             # which already has access to steps, input variables, etc.
             # This is a fallback implementation for direct testing
-            engine = WorkflowTemplateEngine()
+            engine = get_shared_template_engine()
 
             # For direct testing, create a minimal context
             # In real execution, the context will be richer with steps, input, etc.
@@ -85,10 +85,10 @@ class FormatStep(TextProcessStep):
         This method is called by the ExecutionEngine with the full template context
         that includes steps, input variables, etc.
         """
-        from ..template_engine import TemplateRenderError, WorkflowTemplateEngine
+        from ..template_engine import TemplateRenderError, get_shared_template_engine
 
         try:
-            engine = WorkflowTemplateEngine()
+            engine = get_shared_template_engine()
             result = engine.render(self.template, template_context)
             return result
 
@@ -5,6 +5,7 @@ import json
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import cached_property
 from typing import Any
 
 import jsonschema
@@ -60,6 +61,11 @@ class JSONSchemaValidator(BaseValidator):
     def __init__(self, schema: dict[str, Any]):
         self.schema = schema
 
+    @cached_property
+    def _schema_text(self) -> str:
+        """Schema rendered for retry prompts, computed once per validator"""
+        return json.dumps(self.schema, indent=2)
+
     def validate(self, output: str) -> ValidationResult:
         """Validate output against JSON schema"""
 
@@ -99,7 +105,7 @@ class JSONSchemaValidator(BaseValidator):
 Previous response failed validation: {error_msg}
 
 Please respond with valid JSON that matches this schema:
-{json.dumps(self.schema, indent=2)}
+{self._schema_text}
 
 Ensure your response is valid JSON and includes all required fields.
 """
@@ -111,6 +117,11 @@ class PydanticValidator(BaseValidator):
     def __init__(self, model_class: type[BaseModel]):
         self.model_class = model_class
 
+    @cached_property
+    def _schema_text(self) -> str:
+        """Model JSON schema rendered for retry prompts, computed once per validator"""
+        return json.dumps(self.model_class.model_json_schema(), indent=2)
+
     def validate(self, output: str) -> ValidationResult:
         """Validate output against Pydantic model"""
         try:
@@ -147,12 +158,11 @@ class PydanticValidator(BaseValidator):
     def get_retry_prompt_suffix(self, validation_result: ValidationResult) -> str:
         """Get retry prompt for Pydantic validation"""
         error_msg = "; ".join(validation_result.errors)
-        schema = self.model_class.model_json_schema()
         return f"""
 Previous response failed validation: {error_msg}
 
 Please respond with valid JSON that matches this structure:
-{json.dumps(schema, indent=2)}
+{self._schema_text}
 
 Ensure your response is valid JSON and follows the exact field requirements.
 """
@@ -169,6 +179,13 @@ class CustomValidator(BaseValidator):
         self.validator_func = validator_func
         self.criteria = criteria or {}
 
+    @cached_property
+    def _criteria_text(self) -> str:
+        """Criteria rendered for retry prompts, computed once per validator"""
+        if not self.criteria:
+            return ""
+        return f"\nValidation criteria: {json.dumps(self.criteria, indent=2)}"
+
     def validate(self, output: str) -> ValidationResult:
         """Validate using custom function"""
         try:
@@ -183,12 +200,8 @@ class CustomValidator(BaseValidator):
     def get_retry_prompt_suffix(self, validation_result: ValidationResult) -> str:
         """Get retry prompt for custom validation"""
         error_msg = "; ".join(validation_result.errors)
-        criteria_str = ""
-        if self.criteria:
-            criteria_str = f"\nValidation criteria: {json.dumps(self.criteria, indent=2)}"
-
         return f"""
-Previous response failed validation: {error_msg}{criteria_str}
+Previous response failed validation: {error_msg}{self._criteria_text}
 
 Please ensure your response meets all the specified requirements.
 """
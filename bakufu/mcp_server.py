@@ -13,6 +13,7 @@ from typing import Any
 
 from fastmcp import Context, FastMCP
 
+from bakufu.core.input_processor import enable_parsed_file_cache
 from bakufu.mcp_integration import create_mcp_integrator
 
 logger = logging.getLogger(__name__)
@@ -291,9 +292,9 @@ async def _format_mcp_output(
     if workflow_def.output and workflow_def.output.template and isinstance(result, dict):
         # Use template engine to format output
         try:
-            from bakufu.core.template_engine import WorkflowTemplateEngine
+            from bakufu.core.template_engine import get_shared_template_engine
 
-            engine = WorkflowTemplateEngine()
+            engine = get_shared_template_engine()
             context = {"steps": result, "input": input_data or {}}
             return engine.render(workflow_def.output.template, context)
         except Exception as e:
@@ -344,6 +345,9 @@ async def main_async() -> None:
         level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
+    # The server runs many workflows, so repeated file inputs are worth caching
+    enable_parsed_file_cache()
+
     # Initialize integrator
     await initialize_integrator(args.workflow_dir, args.config)
 